@@ -31,3 +31,13 @@ class CalculateMeanTests(unittest.TestCase):
         expected_result = -52.5
         result = weather.calculate_mean(temperatures)
         self.assertEqual(result, expected_result)
+
+    def test_calculate_mean_mixed_floats_and_strings(self):
+        temperatures = [1.0, "2"]
+        expected_result = 1.5
+        result = weather.calculate_mean(temperatures)
+        self.assertEqual(result, expected_result)
+
+    def test_calculate_mean_empty_list(self):
+        with self.assertRaises(ZeroDivisionError):
+            weather.calculate_mean([])
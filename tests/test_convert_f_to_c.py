@@ -31,3 +31,21 @@ class ConvertTempTests(unittest.TestCase):
         expected_result = 25.0
         result = weather.convert_f_to_c(temp_in_f)
         self.assertEqual(result, expected_result)
+
+    def test_convert_f_to_c_list(self):
+        temps_in_f = [90, -10, 64.4]
+        expected_result = [32.2, -23.3, 18]
+        result = weather.convert_f_to_c_list(temps_in_f)
+        self.assertEqual(result, expected_result)
+
+    def test_convert_f_to_c_list_empty(self):
+        temps_in_f = []
+        expected_result = []
+        result = weather.convert_f_to_c_list(temps_in_f)
+        self.assertEqual(result, expected_result)
+
+    def test_convert_f_to_c_list_strings(self):
+        temps_in_f = ["90", "-10", "64.4", "77"]
+        expected_result = [32.2, -23.3, 18, 25.0]
+        result = weather.convert_f_to_c_list(temps_in_f)
+        self.assertEqual(result, expected_result)
@@ -0,0 +1,59 @@
+import unittest
+import weather
+
+
+class ExtractColumnsTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.example_one = [
+            ["2021-07-02T07:00:00+08:00", 49, 67],
+            ["2021-07-03T07:00:00+08:00", 57, 68],
+            ["2021-07-04T07:00:00+08:00", 56, 62],
+            ["2021-07-05T07:00:00+08:00", 55, 61],
+            ["2021-07-06T07:00:00+08:00", 53, 62]
+        ]
+
+    def test_extract_columns(self):
+        expected_result = weather.WeatherColumns(
+            ["2021-07-02T07:00:00+08:00", "2021-07-03T07:00:00+08:00", "2021-07-04T07:00:00+08:00",
+             "2021-07-05T07:00:00+08:00", "2021-07-06T07:00:00+08:00"],
+            [49.0, 57.0, 56.0, 55.0, 53.0],
+            [67.0, 68.0, 62.0, 61.0, 62.0]
+        )
+        result = weather.extract_columns(self.example_one)
+        self.assertEqual(result, expected_result)
+
+    def test_extract_columns_empty_list(self):
+        expected_result = weather.WeatherColumns([], [], [])
+        result = weather.extract_columns([])
+        self.assertEqual(result, expected_result)
+
+    def test_extract_columns_converts_to_floats(self):
+        example_one_floats = [[date, float(low), float(high)] for date, low, high in self.example_one]
+        example_one_strings = [[date, str(low), str(high)] for date, low, high in self.example_one]
+        expected_result = weather.extract_columns(example_one_floats)
+        for weather_data in (self.example_one, example_one_strings):
+            result = weather.extract_columns(weather_data)
+            self.assertEqual(result, expected_result)
+            for temp in result.min_temps + result.max_temps:
+                self.assertIsInstance(temp, float)
+
+    def test_extract_columns_extra_fields(self):
+        weather_data = [row + ["extra"] for row in self.example_one]
+        result = weather.extract_columns(weather_data)
+        self.assertEqual(result, weather.extract_columns(self.example_one))
+
+    def test_summaries_with_shared_columns(self):
+        weather_columns = weather.extract_columns(self.example_one)
+
+        with open("tests/expected_output/example_one_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        result = weather.generate_summary(weather_columns)
+        self.assertEqual(expected_result, result)
+
+        with open("tests/expected_output/example_one_daily_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        result = weather.generate_daily_summary(weather_columns)
+        self.assertEqual(expected_result, result)
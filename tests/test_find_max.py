@@ -43,3 +43,9 @@ class FindMaxTests(unittest.TestCase):
         expected_result = (57.0, 4)
         result = weather.find_max(temperatures)
         self.assertEqual(result, expected_result)
+
+    def test_find_max_mixed_floats_and_strings(self):
+        temperatures = [49.0, "50"]
+        expected_result = (50.0, 1)
+        result = weather.find_max(temperatures)
+        self.assertEqual(result, expected_result)
@@ -44,3 +44,8 @@ class FindMinTests(unittest.TestCase):
         result = weather.find_min(temperatures)
         self.assertEqual(result, expected_result)
 
+    def test_find_min_mixed_floats_and_strings(self):
+        temperatures = [49.0, "40"]
+        expected_result = (40.0, 1)
+        result = weather.find_min(temperatures)
+        self.assertEqual(result, expected_result)
@@ -52,3 +52,10 @@ class GenerateDailySummaryTests(unittest.TestCase):
             expected_result = txt_file.read()
         result = weather.generate_daily_summary(self.example_three)
         self.assertEqual(expected_result, result)
+
+    def test_generate_daily_summary_strings(self):
+        with open("tests/expected_output/example_one_daily_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        example_one_strings = [[date, str(low), str(high)] for date, low, high in self.example_one]
+        result = weather.generate_daily_summary(example_one_strings)
+        self.assertEqual(expected_result, result)
@@ -52,3 +52,19 @@ class GenerateSummaryTests(unittest.TestCase):
             expected_result = txt_file.read()
         result = weather.generate_summary(self.example_three)
         self.assertEqual(expected_result, result)
+
+    def test_generate_summary_strings(self):
+        with open("tests/expected_output/example_one_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        example_one_strings = [[date, str(low), str(high)] for date, low, high in self.example_one]
+        result = weather.generate_summary(example_one_strings)
+        self.assertEqual(expected_result, result)
+
+    def test_generate_summary_strings_of_different_length(self):
+        weather_data = [
+            ["2021-07-02T07:00:00+08:00", "9", "10"],
+            ["2021-07-03T07:00:00+08:00", "10", "9"]
+        ]
+        result = weather.generate_summary(weather_data)
+        self.assertIn("The lowest temperature will be -12.8°C, and will occur on Friday 02 July 2021.", result)
+        self.assertIn("The highest temperature will be -12.2°C, and will occur on Friday 02 July 2021.", result)
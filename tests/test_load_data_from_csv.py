@@ -44,3 +44,7 @@ class LoadCSVTests(unittest.TestCase):
 
         result = weather.load_data_from_csv("tests/data/example_three.csv")
         self.assertListEqual(result, self.example_three)
+
+    def test_load_empty_csv_file(self):
+        result = weather.load_data_from_csv("tests/data/example_empty.csv")
+        self.assertListEqual(result, [])
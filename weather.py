@@ -1,7 +1,15 @@
 import csv
-from datetime import datetime
+from collections import namedtuple
+from datetime import date
+from functools import lru_cache
 
 DEGREE_SYMBOL = u"\N{DEGREE SIGN}C"
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+MONTH_NAMES = (None, "January", "February", "March", "April", "May", "June", "July",
+               "August", "September", "October", "November", "December")
+CSV_BUFFER_SIZE = 1024 * 1024
+
+WeatherColumns = namedtuple("WeatherColumns", ["dates", "min_temps", "max_temps"])
 
 
 def format_temperature(temp):
@@ -16,6 +24,7 @@ def format_temperature(temp):
     return f"{temp}{DEGREE_SYMBOL}"
 
 
+@lru_cache(maxsize=4096)
 def convert_date(iso_string):
     """Converts and ISO formatted date into a human-readable format.
 
@@ -24,8 +33,11 @@ def convert_date(iso_string):
     Returns:
         A date formatted like: Weekday Date Month Year e.g. Tuesday 06 July 2021
     """
-    date_object = datetime.fromisoformat(iso_string)
-    return date_object.strftime("%A %d %B %Y")
+    date_object = date.fromisoformat(iso_string[:10])
+    return (
+        f"{WEEKDAY_NAMES[date_object.weekday()]} {date_object.day:02d}"
+        f" {MONTH_NAMES[date_object.month]} {date_object.year}"
+    )
 
 
 def convert_f_to_c(temp_in_fahrenheit):
@@ -41,6 +53,19 @@ def convert_f_to_c(temp_in_fahrenheit):
     return round(temp_in_celcius,1)
 
 
+def convert_f_to_c_list(temps_in_fahrenheit):
+    """Converts a sequence of temperatures from Fahrenheit to Celcius.
+
+    Args:
+        temps_in_fahrenheit: an iterable of numbers or numeric strings representing temperatures.
+    Returns:
+        A list of floats representing the temperatures in degrees Celcius, rounded to 1 decimal place.
+    """
+    # Same formula as convert_f_to_c, inlined to avoid a function call per element.
+    # Keep the two in step so batch and scalar conversions round identically.
+    return [round((float(temp)-32)*(5/9),1) for temp in temps_in_fahrenheit]
+
+
 def calculate_mean(weather_data):
     """Calculates the mean value from a list of numbers.
 
@@ -49,8 +74,7 @@ def calculate_mean(weather_data):
     Returns:
         A float representing the mean value.
     """
-    new_weather_data =[float(data) for data in weather_data]
-    return sum(new_weather_data)/len(new_weather_data)
+    return sum(map(float, weather_data))/len(weather_data)
 
 def load_data_from_csv(csv_file):
     """Reads a csv file and stores the data in a list.
@@ -58,23 +82,46 @@ def load_data_from_csv(csv_file):
     Args:
         csv_file: a string representing the file path to a csv file.
     Returns:
-        A list of lists, where each sublist is a (non-empty) line in the csv file.
+        A list of lists, where each sublist is a (non-empty) line in the csv file,
+        with the min and max temperatures already converted to floats.
     """
-    with open(csv_file) as file:
-        csv_dictReader = csv.DictReader(file)
-        return [[row["date"], float(row["min"]), float(row["max"])]for row in csv_dictReader if row]
+    with open(csv_file, buffering=CSV_BUFFER_SIZE) as file:
+        csv_reader = csv.reader(file)
+        header = next(csv_reader, None)
+        if header is None:
+            return []
+        date_index, min_index, max_index = header.index("date"), header.index("min"), header.index("max")
+        return [[row[date_index], float(row[min_index]), float(row[max_index])] for row in csv_reader if row]
 
-def find_last_occurance(templist, value):
-    """ Finds the index of the last occurance for the value of interest
+def _argmin_last(values):
+    """Finds the index of the last occurance of the minimum value.
 
-    Args: 
-        temp_list: a list of numbers
-        value: value in which the index of the last occurance needs to be identified
+    Args:
+        values: A non-empty list of floats.
+    Returns:
+        The index of the last occurance of the minimum value.
+    """
+    min_value = values[0]
+    min_index = 0
+    for index, value in enumerate(values):
+        if value <= min_value:
+            min_value, min_index = value, index
+    return min_index
 
+def _argmax_last(values):
+    """Finds the index of the last occurance of the maximum value.
+
+    Args:
+        values: A non-empty list of floats.
     Returns:
-        The index of the last occurance for the value of interest
+        The index of the last occurance of the maximum value.
     """
-    return len(templist) - 1 - templist[::-1].index(value)
+    max_value = values[0]
+    max_index = 0
+    for index, value in enumerate(values):
+        if value >= max_value:
+            max_value, max_index = value, index
+    return max_index
 
 def find_min(weather_data):
     """Calculates the minimum value in a list of numbers.
@@ -86,9 +133,9 @@ def find_min(weather_data):
     """
     if not weather_data:
         return ()
-    else:
-        temps = [float(temp) for temp in weather_data]
-        return min(temps), find_last_occurance(temps, min(temps))
+    temps = list(map(float, weather_data))
+    min_index = _argmin_last(temps)
+    return temps[min_index], min_index
 
 def find_max(weather_data):
     """Calculates the maximum value in a list of numbers.
@@ -100,51 +147,74 @@ def find_max(weather_data):
     """
     if not weather_data:
         return ()
-    else:
-        temps = [float(temp) for temp in weather_data]
-        return max(temps), find_last_occurance(temps, max(temps))
+    temps = list(map(float, weather_data))
+    max_index = _argmax_last(temps)
+    return temps[max_index], max_index
+
+def extract_columns(weather_data):
+    """Splits weather data into a list per column.
+
+    Args:
+        weather_data: A list of lists, where each sublist represents a day of weather data.
+    Returns:
+        A WeatherColumns tuple holding the list of dates and the lists of min and
+        max temperatures, converted to floats.
+    """
+    return WeatherColumns(
+        [sublist[0] for sublist in weather_data],
+        [float(sublist[1]) for sublist in weather_data],
+        [float(sublist[2]) for sublist in weather_data],
+    )
 
 def generate_summary(weather_data):
     """Outputs a summary for the given weather data.
 
     Args:
-        weather_data: A list of lists, where each sublist represents a day of weather data.
+        weather_data: A list of lists, where each sublist represents a day of weather data,
+            or the WeatherColumns extract_columns returned for it, e.g. when also
+            generating the daily summary.
     Returns:
         A string containing the summary information.
     """
-    number_of_days= len(weather_data)
-    min_temp_list =[float(sublist[1]) for sublist in weather_data]
-    min_temp_in_week = find_min(min_temp_list)
-    max_temp_list =[float(sublist[2]) for sublist in weather_data]
-    max_temp_in_week = find_max(max_temp_list)
+    if not isinstance(weather_data, WeatherColumns):
+        weather_data = extract_columns(weather_data)
+    number_of_days= len(weather_data.dates)
+    min_temp_index = _argmin_last(weather_data.min_temps)
+    max_temp_index = _argmax_last(weather_data.max_temps)
+    lowest_temp = convert_f_to_c(weather_data.min_temps[min_temp_index])
+    highest_temp = convert_f_to_c(weather_data.max_temps[max_temp_index])
+    average_low = convert_f_to_c(calculate_mean(weather_data.min_temps))
+    average_high = convert_f_to_c(calculate_mean(weather_data.max_temps))
+    lowest_date = convert_date(weather_data.dates[min_temp_index])
+    highest_date = convert_date(weather_data.dates[max_temp_index])
 
     return (
         f"{number_of_days} Day Overview\n"
-        f"  The lowest temperature will be {convert_f_to_c(min_temp_in_week[0])}°C,"
-        f" and will occur on {convert_date(weather_data [min_temp_in_week[1]][0])}.\n"
-        f"  The highest temperature will be {convert_f_to_c(max_temp_in_week[0])}°C,"
-        f" and will occur on {convert_date(weather_data [max_temp_in_week[1]][0])}.\n"
-        f"  The average low this week is {convert_f_to_c(calculate_mean(min_temp_list))}°C.\n"
-        f"  The average high this week is {convert_f_to_c(calculate_mean(max_temp_list))}°C.\n"
+        f"  The lowest temperature will be {lowest_temp}°C, and will occur on {lowest_date}.\n"
+        f"  The highest temperature will be {highest_temp}°C, and will occur on {highest_date}.\n"
+        f"  The average low this week is {average_low}°C.\n"
+        f"  The average high this week is {average_high}°C.\n"
     )
 
 def generate_daily_summary(weather_data):
     """Outputs a daily summary for the given weather data.
 
     Args:
-        weather_data: A list of lists, where each sublist represents a day of weather data.
+        weather_data: A list of lists, where each sublist represents a day of weather data,
+            or the WeatherColumns extract_columns returned for it, e.g. when also
+            generating the overview summary.
     Returns:
         A string containing the summary information.
     """
-    summary_string = f""
-    for sublist in weather_data:
-        iso_string = sublist[0]
-        min_temp = sublist[1]
-        max_temp = sublist[2]
-        summary_string += (
-            f"---- {convert_date(iso_string)} ----\n"
-            f"  Minimum Temperature: {convert_f_to_c(min_temp)}°C\n"
-            f"  Maximum Temperature: {convert_f_to_c(max_temp)}°C\n\n"
+    if not isinstance(weather_data, WeatherColumns):
+        weather_data = extract_columns(weather_data)
+    return "".join([
+        f"---- {convert_date(iso_string)} ----\n"
+        f"  Minimum Temperature: {min_temp}°C\n"
+        f"  Maximum Temperature: {max_temp}°C\n\n"
+        for iso_string, min_temp, max_temp in zip(
+            weather_data.dates,
+            convert_f_to_c_list(weather_data.min_temps),
+            convert_f_to_c_list(weather_data.max_temps),
         )
-    return summary_string
-    
\ No newline at end of file
+    ])